@@ -1,9 +1,12 @@
 from .config import IntentRouterConfig
+from .registry import IntentRouterRegistry
 from .service import IntentRouterService
-from .types import RouterOutput, RoutingRequest
+from .types import BatchItemResult, RouterOutput, RoutingRequest
 
 __all__ = [
+    "BatchItemResult",
     "IntentRouterConfig",
+    "IntentRouterRegistry",
     "IntentRouterService",
     "RouterOutput",
     "RoutingRequest",
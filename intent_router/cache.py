@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .exceptions import RouterConfigurationError
+from .types import ModelPrediction, RequestFeatures
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decisions (
+    key TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL DEFAULT '',
+    payload TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cache_meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_meta (name, value)
+    VALUES ('entries', (SELECT COUNT(*) FROM decisions));
+"""
+
+# Created after ``_migrate`` so files written before the namespace column
+# existed can be upgraded in place; their rows keep an empty namespace and
+# are never warm-started.
+_INDEXES = """
+DROP INDEX IF EXISTS decisions_by_heat;
+CREATE INDEX IF NOT EXISTS decisions_by_namespace_heat
+    ON decisions (namespace, hits, last_used);
+CREATE INDEX IF NOT EXISTS decisions_by_recency ON decisions (last_used);
+"""
+
+
+class PersistentDecisionCache:
+    """Routing decisions persisted in a local SQLite file shared by workers.
+
+    The database runs in WAL mode so many processes can read concurrently
+    while SQLite serializes writers. Hit counters are buffered in memory and
+    flushed with the next write or every ``hit_flush_interval_seconds``.
+    Eviction is least-recently-used; rows written by the current
+    transaction are never evicted by it. The row count is kept in
+    ``cache_meta`` so writes do not rescan the table.
+
+    The cache is an optimization, so SQLite errors after start-up are logged
+    and degrade lookups to misses and writes to no-ops instead of failing
+    the batch.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        router_version: str,
+        classification_labels: Sequence[str],
+        max_entries: int = 100_000,
+        busy_timeout_seconds: float = 5.0,
+        hit_flush_interval_seconds: float = 5.0,
+    ) -> None:
+        if max_entries <= 0:
+            raise RouterConfigurationError("decision cache max_entries must be positive")
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._namespace = "\0".join([router_version, *classification_labels])
+        self._namespace_id = hashlib.sha256(self._namespace.encode("utf-8")).hexdigest()
+        self._lock = threading.Lock()
+        self._warm: Dict[str, ModelPrediction] = {}
+        # key -> (hit count, wall-clock time of the latest hit)
+        self._pending_hits: Dict[str, Tuple[int, float]] = {}
+        self.hit_flush_interval_seconds = hit_flush_interval_seconds
+        self._last_flush = time.monotonic()
+        self._closed = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path,
+            timeout=busy_timeout_seconds,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._migrate()
+        self._connection.executescript(_INDEXES)
+
+    def key_for(self, features: RequestFeatures) -> str:
+        digest = hashlib.sha256(f"{self._namespace}\0{features.folded}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def warm_start(self, limit: int) -> int:
+        """Preload this namespace's ``limit`` most frequently hit decisions."""
+
+        if limit <= 0:
+            return 0
+        with self._lock:
+            try:
+                rows = self._connection.execute(
+                    "SELECT key, payload FROM decisions WHERE namespace = ? "
+                    "ORDER BY hits DESC, last_used DESC LIMIT ?",
+                    (self._namespace_id, limit),
+                ).fetchall()
+            except sqlite3.Error:
+                logger.exception("decision cache warm start failed; starting cold")
+                return 0
+            for key, payload in rows:
+                self._warm[key] = _decode(payload)
+        return len(rows)
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[ModelPrediction]]:
+        results: List[Optional[ModelPrediction]] = [None] * len(keys)
+        missing: Dict[str, List[int]] = {}
+        with self._lock:
+            if self._closed:
+                return results
+            for position, key in enumerate(keys):
+                warm = self._warm.get(key)
+                if warm is not None:
+                    results[position] = warm
+                else:
+                    missing.setdefault(key, []).append(position)
+            if missing:
+                placeholders = ",".join("?" for _ in missing)
+                try:
+                    rows = self._connection.execute(
+                        f"SELECT key, payload FROM decisions WHERE key IN ({placeholders})",
+                        tuple(missing),
+                    ).fetchall()
+                except sqlite3.Error:
+                    logger.exception("decision cache lookup failed; treating as misses")
+                    rows = []
+                for key, payload in rows:
+                    prediction = _decode(payload)
+                    for position in missing[key]:
+                        results[position] = prediction
+            hit_time = time.time()
+            for key, prediction in zip(keys, results):
+                if prediction is not None:
+                    count, _ = self._pending_hits.get(key, (0, hit_time))
+                    self._pending_hits[key] = (count + 1, hit_time)
+            if (
+                self._pending_hits
+                and time.monotonic() - self._last_flush >= self.hit_flush_interval_seconds
+            ):
+                self._write_or_log([])
+        return results
+
+    def put_many(self, entries: Iterable[Tuple[str, ModelPrediction]]) -> None:
+        rows = [(key, _encode(prediction)) for key, prediction in entries]
+        with self._lock:
+            if not self._closed:
+                self._write_or_log(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._entry_count()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._write_or_log([])
+            self._closed = True
+            self._connection.close()
+
+    def _write_or_log(self, rows: Sequence[Tuple[str, str]]) -> None:
+        try:
+            self._write_locked(rows)
+        except sqlite3.Error:
+            logger.exception("decision cache write failed; dropping %d entries", len(rows))
+
+    def _write_locked(self, rows: Sequence[Tuple[str, str]]) -> None:
+        now = time.time()
+        hits = [(count, hit_time, key) for key, (count, hit_time) in self._pending_hits.items()]
+        self._pending_hits.clear()
+        self._last_flush = time.monotonic()
+        if not rows and not hits:
+            return
+        with self._transaction():
+            # Flushed hits carry their own (earlier) timestamps, so only the
+            # rows written now are stamped ``now`` and shielded from eviction.
+            self._connection.executemany(
+                "UPDATE decisions SET hits = hits + ?, last_used = MAX(last_used, ?) "
+                "WHERE key = ?",
+                hits,
+            )
+            inserted = self._connection.executemany(
+                "INSERT OR IGNORE INTO decisions (key, namespace, payload, hits, last_used) "
+                "VALUES (?, ?, ?, 0, ?)",
+                [(key, self._namespace_id, payload, now) for key, payload in rows],
+            ).rowcount
+            self._connection.executemany(
+                "UPDATE decisions SET payload = ?, last_used = ? WHERE key = ?",
+                [(payload, now, key) for key, payload in rows],
+            )
+            self._adjust_entry_count(max(inserted, 0))
+            self._evict_overflow(now)
+
+    def _migrate(self) -> None:
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(decisions)")}
+        if "namespace" not in columns:
+            self._connection.execute(
+                "ALTER TABLE decisions ADD COLUMN namespace TEXT NOT NULL DEFAULT ''"
+            )
+
+    def _entry_count(self) -> int:
+        row = self._connection.execute(
+            "SELECT value FROM cache_meta WHERE name = 'entries'"
+        ).fetchone()
+        return int(row[0]) if row else 0
+
+    def _adjust_entry_count(self, delta: int) -> None:
+        if delta:
+            self._connection.execute(
+                "UPDATE cache_meta SET value = value + ? WHERE name = 'entries'", (delta,)
+            )
+
+    def _evict_overflow(self, written_at: float) -> None:
+        overflow = self._entry_count() - self.max_entries
+        if overflow > 0:
+            deleted = self._connection.execute(
+                "DELETE FROM decisions WHERE key IN ("
+                "SELECT key FROM decisions WHERE last_used < ? "
+                "ORDER BY last_used ASC, hits ASC LIMIT ?)",
+                (written_at, overflow),
+            ).rowcount
+            self._adjust_entry_count(-deleted)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+
+def _encode(prediction: ModelPrediction) -> str:
+    return json.dumps(
+        {
+            "intent": prediction.intent,
+            "confidence": prediction.confidence,
+            "reasoning": prediction.reasoning,
+            "language": prediction.language,
+            "metadata": prediction.metadata,
+        },
+        default=str,
+        ensure_ascii=False,
+    )
+
+
+def _decode(payload: str) -> ModelPrediction:
+    data = json.loads(payload)
+    return ModelPrediction(
+        intent=data["intent"],
+        confidence=data["confidence"],
+        reasoning=data["reasoning"],
+        language=data["language"],
+        fallback_used=False,
+        metadata=data.get("metadata", {}),
+    )
+
+
+__all__ = ["PersistentDecisionCache"]
@@ -30,6 +30,14 @@ class IntentRouterConfig:
     compliance_log_context: Dict[str, str] = field(default_factory=dict)
     fallback_timeout_seconds: float = 0.3
     offline_mode: bool = False
+    max_workers: int = 1
+    max_chunks_in_flight: int | None = None
+    dedup_enabled: bool = False
+    dedup_similarity_threshold: float = 0.8
+    dedup_window_size: int = 4096
+    decision_cache_path: Path | None = None
+    decision_cache_max_entries: int = 100_000
+    decision_cache_warm_entries: int = 0
 
     def __post_init__(self) -> None:
         path = Path(self.model_path)
@@ -41,5 +49,23 @@ class IntentRouterConfig:
             raise RouterConfigurationError("max_batch_size must be greater than zero")
         if self.max_prompt_chars <= 0:
             raise RouterConfigurationError("max_prompt_chars must be greater than zero")
+        if self.max_workers <= 0:
+            raise RouterConfigurationError("max_workers must be greater than zero")
+        if self.max_chunks_in_flight is not None and self.max_chunks_in_flight <= 0:
+            raise RouterConfigurationError("max_chunks_in_flight must be greater than zero")
+        if not 0 < self.dedup_similarity_threshold <= 1:
+            raise RouterConfigurationError(
+                "dedup_similarity_threshold must be within (0, 1]"
+            )
+        if self.dedup_window_size <= 0:
+            raise RouterConfigurationError("dedup_window_size must be greater than zero")
+        if self.decision_cache_max_entries <= 0:
+            raise RouterConfigurationError(
+                "decision_cache_max_entries must be greater than zero"
+            )
+        if self.decision_cache_warm_entries < 0:
+            raise RouterConfigurationError("decision_cache_warm_entries cannot be negative")
+        if self.decision_cache_path is not None:
+            self.decision_cache_path = Path(self.decision_cache_path)
         self.model_path = path
         self.classification_labels = tuple(self.classification_labels)
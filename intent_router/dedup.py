@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, FrozenSet, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+from .exceptions import RouterConfigurationError
+
+T = TypeVar("T")
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_NUMERIC_TOKEN = "<num>"
+
+
+def dedup_tokens(tokens: Iterable[str]) -> FrozenSet[str]:
+    """Collapse tokens that only carry identifiers (order numbers, ids)."""
+
+    return frozenset(
+        _NUMERIC_TOKEN if any(char.isdigit() for char in token) else token
+        for token in tokens
+    )
+
+
+def _token_hash(token: str) -> int:
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _permutations(num_perm: int) -> List[Tuple[int, int]]:
+    # Derived from a fixed seed so signatures are stable across processes.
+    permutations: List[Tuple[int, int]] = []
+    for index in range(num_perm):
+        seed = hashlib.blake2b(f"minhash-{index}".encode("ascii"), digest_size=16).digest()
+        a = int.from_bytes(seed[:8], "little") % (_MERSENNE_PRIME - 1) + 1
+        b = int.from_bytes(seed[8:], "little") % _MERSENNE_PRIME
+        permutations.append((a, b))
+    return permutations
+
+
+@dataclass(slots=True)
+class _IndexEntry(Generic[T]):
+    tokens: FrozenSet[str]
+    band_keys: Tuple[Tuple[int, ...], ...]
+    value: T
+
+
+class NearDuplicateIndex(Generic[T]):
+    """MinHash/LSH index over token sets with a bounded FIFO window.
+
+    Candidates are found through banded MinHash signatures and confirmed
+    with the exact Jaccard similarity of the stored token sets. Lookups and
+    updates are serialized by a lock so one index can serve many threads.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        window_size: int = 4096,
+        num_perm: int = 32,
+        bands: int = 8,
+    ) -> None:
+        if not 0 < threshold <= 1:
+            raise RouterConfigurationError("dedup threshold must be within (0, 1]")
+        if window_size <= 0:
+            raise RouterConfigurationError("dedup window_size must be greater than zero")
+        if num_perm <= 0 or bands <= 0 or num_perm % bands:
+            raise RouterConfigurationError("num_perm must be a positive multiple of bands")
+        self.threshold = threshold
+        self.window_size = window_size
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._permutations = _permutations(num_perm)
+        self._entries: Dict[int, _IndexEntry[T]] = {}
+        self._order: Deque[int] = deque()
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def signature(self, tokens: FrozenSet[str]) -> Tuple[int, ...]:
+        if not tokens:
+            return ()
+        hashes = [_token_hash(token) for token in tokens]
+        return tuple(
+            min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in hashes)
+            for a, b in self._permutations
+        )
+
+    def query(
+        self, tokens: FrozenSet[str], signature: Optional[Tuple[int, ...]] = None
+    ) -> Optional[T]:
+        """Return the value of the most similar entry above the threshold."""
+
+        if not tokens:
+            return None
+        signature = signature if signature is not None else self.signature(tokens)
+        band_keys = self._band_keys(signature)
+        best: Optional[_IndexEntry[T]] = None
+        best_score = 0.0
+        seen: set[int] = set()
+        with self._lock:
+            for band, key in enumerate(band_keys):
+                for entry_id in self._buckets.get((band, key), ()):
+                    if entry_id in seen:
+                        continue
+                    seen.add(entry_id)
+                    entry = self._entries[entry_id]
+                    score = _jaccard(tokens, entry.tokens)
+                    if score >= self.threshold and score > best_score:
+                        best, best_score = entry, score
+        return best.value if best is not None else None
+
+    def add(
+        self,
+        tokens: FrozenSet[str],
+        value: T,
+        signature: Optional[Tuple[int, ...]] = None,
+    ) -> None:
+        if not tokens:
+            return
+        signature = signature if signature is not None else self.signature(tokens)
+        band_keys = self._band_keys(signature)
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = _IndexEntry(
+                tokens=tokens, band_keys=band_keys, value=value
+            )
+            self._order.append(entry_id)
+            for band, key in enumerate(band_keys):
+                self._buckets.setdefault((band, key), []).append(entry_id)
+            while len(self._order) > self.window_size:
+                self._evict(self._order.popleft())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._order.clear()
+            self._buckets.clear()
+
+    def _evict(self, entry_id: int) -> None:
+        # Caller holds ``self._lock``.
+        entry = self._entries.pop(entry_id)
+        for band, key in enumerate(entry.band_keys):
+            bucket = self._buckets.get((band, key))
+            if bucket is None:
+                continue
+            bucket.remove(entry_id)
+            if not bucket:
+                del self._buckets[(band, key)]
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> Tuple[Tuple[int, ...], ...]:
+        rows = self.rows
+        return tuple(
+            signature[band * rows : (band + 1) * rows] for band in range(self.bands)
+        )
+
+
+def _jaccard(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    union = len(left | right)
+    return len(left & right) / union if union else 0.0
+
+
+__all__ = ["NearDuplicateIndex", "dedup_tokens"]
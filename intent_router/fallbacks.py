@@ -63,7 +63,7 @@ class RegexFallbackRouter:
         language: LanguageContext,
         offline_reason: str,
     ) -> ModelPrediction:
-        normalized = request.text.lower().strip()
+        normalized = request.features().full_folded
         for rule in self.rules:
             if rule.pattern.search(normalized):
                 metadata = {
@@ -54,7 +54,11 @@ class LinguaLanguageDetector:
     }
 
     def detect(self, text: str) -> LanguageContext:
-        normalized = text.strip().lower()
+        return self.detect_normalized(text.strip().lower())
+
+    def detect_normalized(self, normalized: str) -> LanguageContext:
+        """Detect the language of text that is already stripped and lower-cased."""
+
         if not normalized:
             return LanguageContext(language_code="en", confidence=0.0)
 
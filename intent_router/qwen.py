@@ -4,10 +4,22 @@ import re
 from typing import Iterable, List, Sequence
 
 from .config import IntentRouterConfig
-from .exceptions import FinancialAdviceViolation, RouterModelUnavailableError
+from .exceptions import FinancialAdviceViolation, RouterError, RouterModelUnavailableError
 from .types import LanguageContext, ModelPrediction, RoutingRequest
 
 
+_FINANCIAL_GUARDRAIL = re.compile(
+    r"financial advice|stock tip|investment recommendation|crypto pick",
+    re.I,
+)
+
+
+def violates_financial_guardrail(text: str) -> bool:
+    """Cheap check shared by the model and stages that skip classification."""
+
+    return _FINANCIAL_GUARDRAIL.search(text) is not None
+
+
 class LightweightQwenIntentModel:
     """Offline-friendly heuristic wrapper that emulates Qwen 30B classification."""
 
@@ -27,11 +39,6 @@ class LightweightQwenIntentModel:
         "general_inquiry": (re.compile(r".*", re.S),),
     }
 
-    _FINANCIAL_GUARDRAIL = re.compile(
-        r"financial advice|stock tip|investment recommendation|crypto pick",
-        re.I,
-    )
-
     def __init__(self, config: IntentRouterConfig):
         self.config = config
 
@@ -39,42 +46,88 @@ class LightweightQwenIntentModel:
         self,
         requests: Sequence[RoutingRequest],
         languages: Sequence[LanguageContext],
+        classification_labels: Sequence[Sequence[str]] | None = None,
     ) -> List[ModelPrediction]:
+        """Classify a batch; ``classification_labels`` overrides labels per request."""
+
         if self.config.offline_mode:
             raise RouterModelUnavailableError("Offline mode enforced; model skipped")
 
-        predictions: List[ModelPrediction] = []
-        for request, language in zip(requests, languages):
-            prompt = self._build_prompt(request.text, language.language_code)
-            truncated_text = request.text.strip()[: self.config.max_prompt_chars]
-            self._enforce_financial_guardrail(truncated_text)
-            intent, reasoning = self._infer_intent(truncated_text)
-            confidence = 0.9 if intent != "general_inquiry" else 0.6
-            metadata = {
-                "language_detector_confidence": language.confidence,
-                "prompt_excerpt": prompt[:160],
-                "model_path": str(self.config.model_path),
-                "classification_labels": list(self.config.classification_labels),
-            }
-            predictions.append(
-                ModelPrediction(
-                    intent=intent,
-                    confidence=confidence,
-                    reasoning=reasoning,
-                    language=language.language_code,
-                    fallback_used=False,
-                    metadata=metadata,
-                )
+        return [
+            self._classify_one(request, language, labels)
+            for request, language, labels in zip(
+                requests, languages, self._resolve_labels(requests, classification_labels)
             )
-        return predictions
+        ]
+
+    def classify_items(
+        self,
+        requests: Sequence[RoutingRequest],
+        languages: Sequence[LanguageContext],
+        classification_labels: Sequence[Sequence[str]] | None = None,
+    ) -> List[ModelPrediction | RouterError]:
+        """Classify each request independently, returning guardrail errors in place."""
 
-    def _build_prompt(self, text: str, language_code: str) -> str:
+        if self.config.offline_mode:
+            raise RouterModelUnavailableError("Offline mode enforced; model skipped")
+
+        results: List[ModelPrediction | RouterError] = []
+        for request, language, labels in zip(
+            requests, languages, self._resolve_labels(requests, classification_labels)
+        ):
+            try:
+                results.append(self._classify_one(request, language, labels))
+            except FinancialAdviceViolation as error:
+                results.append(error)
+        return results
+
+    def _resolve_labels(
+        self,
+        requests: Sequence[RoutingRequest],
+        classification_labels: Sequence[Sequence[str]] | None,
+    ) -> Sequence[Sequence[str]]:
+        if classification_labels is None:
+            return [self.config.classification_labels] * len(requests)
+        return classification_labels
+
+    def _classify_one(
+        self,
+        request: RoutingRequest,
+        language: LanguageContext,
+        labels: Sequence[str],
+    ) -> ModelPrediction:
+        features = request.features(self.config.max_prompt_chars)
+        truncated_text = features.text
+        prompt = self._build_prompt(truncated_text, language.language_code, labels)
+        self._enforce_financial_guardrail(truncated_text)
+        intent, reasoning = self._infer_intent(truncated_text)
+        confidence = 0.9 if intent != "general_inquiry" else 0.6
+        metadata = {
+            "language_detector_confidence": language.confidence,
+            "prompt_excerpt": prompt[:160],
+            "model_path": str(self.config.model_path),
+            "classification_labels": list(labels),
+        }
+        return ModelPrediction(
+            intent=intent,
+            confidence=confidence,
+            reasoning=reasoning,
+            language=language.language_code,
+            fallback_used=False,
+            metadata=metadata,
+        )
+
+    def _build_prompt(
+        self, text: str, language_code: str, labels: Sequence[str] | None = None
+    ) -> str:
         safe_text = text.replace("`", "\u0060")
-        labels = ", ".join(self.config.classification_labels)
+        label_list = ", ".join(
+            labels if labels is not None else self.config.classification_labels
+        )
         return (
             "System: You are Qwen-30B operating fully offline with local weights."
             " Classify the provided utterance into one of the following intents: "
-            f"{labels}. Only return the canonical intent name and reasoning. "
+            f"{label_list}. Only return the canonical intent name and reasoning. "
             f"User language={language_code}. Utterance: ```{safe_text}```"
         )
 
@@ -87,10 +140,10 @@ class LightweightQwenIntentModel:
         return "general_inquiry", "No high-confidence lexical match"
 
     def _enforce_financial_guardrail(self, text: str) -> None:
-        if self._FINANCIAL_GUARDRAIL.search(text):
+        if violates_financial_guardrail(text):
             raise FinancialAdviceViolation(
                 "Financial advice prompts are not permitted in the intent router"
             )
 
 
-__all__ = ["LightweightQwenIntentModel"]
+__all__ = ["LightweightQwenIntentModel", "violates_financial_guardrail"]
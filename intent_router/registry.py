@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, MutableSequence, Optional, Sequence
+
+from .cache import PersistentDecisionCache
+from .config import IntentRouterConfig
+from .dedup import NearDuplicateIndex
+from .exceptions import RouterConfigurationError, RouterError
+from .fallbacks import RegexFallbackRouter
+from .language_detection import LinguaLanguageDetector
+from .qwen import LightweightQwenIntentModel
+from .service import Decision, IntentRouterService
+from .telemetry import ComplianceLogger
+from .types import (
+    BatchItemResult,
+    LanguageContext,
+    ModelPrediction,
+    RouterOutput,
+    RoutingRequest,
+)
+
+
+class _TenantModelView:
+    """Forwards classification to the shared model with per-request labels."""
+
+    def __init__(
+        self,
+        model: LightweightQwenIntentModel,
+        labels_for: Callable[[RoutingRequest], Sequence[str]],
+    ) -> None:
+        self.model = model
+        self.labels_for = labels_for
+        if hasattr(model, "classify_items"):
+            self.classify_items = self._classify_items
+
+    def classify(
+        self,
+        requests: Sequence[RoutingRequest],
+        languages: Sequence[LanguageContext],
+    ) -> List[ModelPrediction]:
+        labels = [self.labels_for(request) for request in requests]
+        return self.model.classify(requests, languages, classification_labels=labels)
+
+    def _classify_items(
+        self,
+        requests: Sequence[RoutingRequest],
+        languages: Sequence[LanguageContext],
+    ) -> List[ModelPrediction | RouterError]:
+        labels = [self.labels_for(request) for request in requests]
+        return self.model.classify_items(requests, languages, classification_labels=labels)
+
+
+class _MixedTenantService(IntentRouterService):
+    """Routes one batch that mixes tenants against a snapshot of their views.
+
+    Built per call, so tenants added or removed meanwhile cannot affect a
+    batch in flight. Dedup indexes and decision caches are borrowed from
+    each request's tenant view, keeping them namespaced per tenant.
+    """
+
+    def __init__(
+        self,
+        registry: "IntentRouterRegistry",
+        views: Dict[str, IntentRouterService],
+    ) -> None:
+        self._views = views
+        super().__init__(
+            registry.mixed_config,
+            llm_client=_TenantModelView(  # type: ignore[arg-type]
+                registry.llm_client,
+                self._labels_for,
+            ),
+            language_detector=registry.language_detector,
+            fallback_router=registry.fallback_router,
+            telemetry=ComplianceLogger(sink=registry.telemetry_sink),
+            executor=registry.executor,
+        )
+
+    def _view(self, request: RoutingRequest) -> IntentRouterService:
+        return self._views[request.tenant_id or ""]
+
+    def _decision_cache_for(
+        self, request: RoutingRequest
+    ) -> PersistentDecisionCache | None:
+        return self._view(request).decision_cache
+
+    def _dedup_index_for(
+        self, request: RoutingRequest
+    ) -> NearDuplicateIndex[Decision] | None:
+        return self._view(request).dedup_index
+
+    def _labels_for(self, request: RoutingRequest) -> Sequence[str]:
+        return self._view(request).config.classification_labels
+
+    def _build_output(
+        self,
+        request: RoutingRequest,
+        prediction: ModelPrediction,
+        language: LanguageContext,
+    ) -> RouterOutput:
+        output = super()._build_output(request, prediction, language)
+        output.router_version = self._view(request).config.router_version
+        return output
+
+    def _emit_telemetry(self, output: RouterOutput, request: RoutingRequest) -> None:
+        self._view(request)._emit_telemetry(output, request)
+
+
+class IntentRouterRegistry:
+    """Serves many tenants from one detector, fallback table and Qwen model.
+
+    Each tenant is an ``IntentRouterService`` view carrying its own labels,
+    compliance context and router version while sharing the heavy
+    components. The shared model must accept ``classification_labels``.
+    """
+
+    def __init__(
+        self,
+        config: IntentRouterConfig,
+        llm_client: LightweightQwenIntentModel | None = None,
+        language_detector: LinguaLanguageDetector | None = None,
+        fallback_router: RegexFallbackRouter | None = None,
+        telemetry_sink: Optional[MutableSequence[Dict[str, Any]]] = None,
+    ) -> None:
+        self.config = config
+        self.llm_client = llm_client or LightweightQwenIntentModel(config)
+        self.language_detector = language_detector or LinguaLanguageDetector()
+        self.fallback_router = fallback_router or RegexFallbackRouter()
+        self.telemetry_sink = telemetry_sink
+        self.executor: ThreadPoolExecutor | None = None
+        if config.max_workers > 1:
+            self.executor = ThreadPoolExecutor(
+                max_workers=config.max_workers, thread_name_prefix="intent-router"
+            )
+        # Mixed batches use the tenant views' caches and indexes, never their own.
+        self.mixed_config = replace(config, dedup_enabled=False, decision_cache_path=None)
+        self._tenants: Dict[str, IntentRouterService] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def tenant_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._tenants)
+
+    def __contains__(self, tenant_id: object) -> bool:
+        with self._lock:
+            return tenant_id in self._tenants
+
+    def add_tenant(
+        self,
+        tenant_id: str,
+        classification_labels: Sequence[str] | None = None,
+        compliance_log_context: Dict[str, str] | None = None,
+        router_version: str | None = None,
+    ) -> IntentRouterService:
+        overrides: Dict[str, Any] = {}
+        if classification_labels is not None:
+            overrides["classification_labels"] = classification_labels
+        if compliance_log_context is not None:
+            overrides["compliance_log_context"] = compliance_log_context
+        if router_version is not None:
+            overrides["router_version"] = router_version
+        tenant_config = replace(self.config, **overrides)
+        labels = tenant_config.classification_labels
+        service = IntentRouterService(
+            tenant_config,
+            llm_client=_TenantModelView(  # type: ignore[arg-type]
+                self.llm_client, lambda request: labels
+            ),
+            language_detector=self.language_detector,
+            fallback_router=self.fallback_router,
+            telemetry=ComplianceLogger(
+                extra_context={"tenant_id": tenant_id, **tenant_config.compliance_log_context},
+                sink=self.telemetry_sink,
+            ),
+            executor=self.executor,
+        )
+        with self._lock:
+            if tenant_id in self._tenants:
+                service.close()
+                raise RouterConfigurationError(f"Tenant '{tenant_id}' is already registered")
+            self._tenants[tenant_id] = service
+        return service
+
+    def remove_tenant(self, tenant_id: str) -> None:
+        with self._lock:
+            service = self._tenants.pop(tenant_id, None)
+        if service is None:
+            raise RouterConfigurationError(f"Unknown tenant '{tenant_id}'")
+        service.close()
+
+    def tenant(self, tenant_id: str) -> IntentRouterService:
+        with self._lock:
+            service = self._tenants.get(tenant_id)
+        if service is None:
+            raise RouterConfigurationError(f"Unknown tenant '{tenant_id}'")
+        return service
+
+    def route_batch(
+        self,
+        requests: Sequence[RoutingRequest],
+        offline_override: bool = False,
+    ) -> List[RouterOutput]:
+        """Route requests from several tenants, sharing model calls across them."""
+
+        views = self._snapshot_views(requests)
+        return _MixedTenantService(self, views).route_batch(
+            requests, offline_override=offline_override
+        )
+
+    def route_batch_partial(
+        self,
+        requests: Sequence[RoutingRequest],
+        offline_override: bool = False,
+    ) -> List[BatchItemResult]:
+        views = self._snapshot_views(requests)
+        return _MixedTenantService(self, views).route_batch_partial(
+            requests, offline_override=offline_override
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            services = list(self._tenants.values())
+            self._tenants.clear()
+        for service in services:
+            service.close()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    def __enter__(self) -> "IntentRouterRegistry":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _snapshot_views(
+        self, requests: Sequence[RoutingRequest]
+    ) -> Dict[str, IntentRouterService]:
+        with self._lock:
+            tenants = dict(self._tenants)
+        views: Dict[str, IntentRouterService] = {}
+        for request in requests:
+            tenant_id = getattr(request, "tenant_id", None)
+            if not isinstance(request, RoutingRequest) or tenant_id not in tenants:
+                raise RouterConfigurationError(
+                    f"Request tenant '{tenant_id}' is not registered with the router registry"
+                )
+            views[tenant_id] = tenants[tenant_id]
+        return views
+
+
+__all__ = ["IntentRouterRegistry"]
@@ -1,21 +1,93 @@
 from __future__ import annotations
 
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Iterable, List, Sequence
+from typing import (
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from .config import IntentRouterConfig
 from .exceptions import (
     MemoryBudgetExceeded,
+    RouterError,
     RouterModelUnavailableError,
     RouterTimeoutError,
+    SchemaValidationError,
 )
+from .cache import PersistentDecisionCache
+from .dedup import NearDuplicateIndex, dedup_tokens
 from .fallbacks import RegexFallbackRouter
 from .language_detection import LinguaLanguageDetector
-from .qwen import LightweightQwenIntentModel
+from .qwen import LightweightQwenIntentModel, violates_financial_guardrail
 from .schema import validate_router_output
 from .telemetry import ComplianceLogger
-from .types import LanguageContext, ModelPrediction, RouterOutput, RoutingRequest
+from .types import (
+    BatchItemResult,
+    LanguageContext,
+    ModelPrediction,
+    RouterOutput,
+    RoutingRequest,
+)
+
+T = TypeVar("T")
+
+# Indexed decisions remember which request they were classified from.
+Decision = Tuple[ModelPrediction, LanguageContext, Optional[str]]
+Outcome = Union[RouterOutput, RouterError]
+ChunkPrediction = Tuple[List[Union[ModelPrediction, RouterError]], List[LanguageContext]]
+
+# Prediction metadata describing the classified text itself; it is dropped
+# when a decision is fanned out to a near-duplicate member.
+_TEXT_DERIVED_METADATA = frozenset({"prompt_excerpt"})
+
+
+def _clamp_to_labels(prediction: ModelPrediction, labels: Sequence[str]) -> ModelPrediction:
+    """Never answer with an intent the caller did not configure.
+
+    Applied to every prediction, whether it came from the model, the
+    decision cache or the regex fallback.
+    """
+
+    if not labels or prediction.intent in labels:
+        return prediction
+    intent = "general_inquiry" if "general_inquiry" in labels else labels[0]
+    return replace(
+        prediction,
+        intent=intent,
+        reasoning=f"{prediction.reasoning}; '{prediction.intent}' is not a configured label",
+        metadata={**prediction.metadata, "intent_clamped_from": prediction.intent},
+    )
+
+
+@dataclass(slots=True, eq=False)
+class _Cluster:
+    """Near-duplicate requests resolved by a single decision."""
+
+    leader: int
+    representative_id: Optional[str]
+    index: Optional[NearDuplicateIndex[Decision]] = None
+    tokens: FrozenSet[str] = frozenset()
+    signature: Tuple[int, ...] = ()
+    members: List[int] = field(default_factory=list)
+    from_index: bool = False
+    prediction: ModelPrediction | RouterError | None = None
+    language: LanguageContext = field(
+        default_factory=lambda: LanguageContext(language_code="en", confidence=0.0)
+    )
 
 
 class IntentRouterService:
@@ -28,6 +100,9 @@ class IntentRouterService:
         language_detector: LinguaLanguageDetector | None = None,
         fallback_router: RegexFallbackRouter | None = None,
         telemetry: ComplianceLogger | None = None,
+        dedup_index: NearDuplicateIndex[Decision] | None = None,
+        decision_cache: PersistentDecisionCache | None = None,
+        executor: ThreadPoolExecutor | None = None,
     ) -> None:
         self.config = config
         self.language_detector = language_detector or LinguaLanguageDetector()
@@ -36,6 +111,45 @@ class IntentRouterService:
         self.telemetry = telemetry or ComplianceLogger(
             extra_context=config.compliance_log_context
         )
+        if dedup_index is None and config.dedup_enabled:
+            dedup_index = NearDuplicateIndex(
+                threshold=config.dedup_similarity_threshold,
+                window_size=config.dedup_window_size,
+            )
+        self.dedup_index = dedup_index
+        if decision_cache is None and config.decision_cache_path is not None:
+            decision_cache = PersistentDecisionCache(
+                config.decision_cache_path,
+                router_version=config.router_version,
+                classification_labels=config.classification_labels,
+                max_entries=config.decision_cache_max_entries,
+            )
+        if decision_cache is not None and config.decision_cache_warm_entries:
+            decision_cache.warm_start(config.decision_cache_warm_entries)
+        self.decision_cache = decision_cache
+        # A caller-supplied executor is shared with other services and not owned.
+        self._owns_executor = executor is None and config.max_workers > 1
+        if self._owns_executor:
+            executor = ThreadPoolExecutor(
+                max_workers=config.max_workers, thread_name_prefix="intent-router"
+            )
+        self._executor = executor
+
+    def close(self) -> None:
+        """Release the chunk worker pool and decision cache, if configured."""
+
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        if self.decision_cache is not None:
+            self.decision_cache.close()
+            self.decision_cache = None
+
+    def __enter__(self) -> "IntentRouterService":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def route(
         self,
@@ -54,43 +168,508 @@ class IntentRouterService:
     ) -> List[RouterOutput]:
         normalized = self._normalize_requests(requests)
         self._enforce_memory_budget(normalized)
+        # Without failure isolation every outcome is a RouterOutput; errors raise.
+        outcomes = self._route_all(normalized, offline_override, isolate_failures=False)
+        return outcomes  # type: ignore[return-value]
+
+    def route_batch_partial(
+        self,
+        requests: Sequence[RoutingRequest | str],
+        offline_override: bool = False,
+    ) -> List[BatchItemResult]:
+        """Route a batch returning one result-or-error slot per input.
+
+        Guardrail, schema and latency failures are recorded against the
+        offending item instead of aborting the batch, so work finished for
+        other items is kept and clients only need to retry the failures.
+        """
+
+        normalized = self._normalize_requests(requests)
+        self._enforce_memory_budget(normalized)
+        outcomes = self._route_all(normalized, offline_override, isolate_failures=True)
+        results: List[BatchItemResult] = []
+        for request, outcome in zip(normalized, outcomes):
+            if isinstance(outcome, RouterError):
+                results.append(BatchItemResult(request_id=request.request_id, error=outcome))
+            else:
+                results.append(BatchItemResult(request_id=request.request_id, output=outcome))
+        return results
+
+    def _route_all(
+        self,
+        requests: Sequence[RoutingRequest],
+        offline_override: bool,
+        isolate_failures: bool,
+    ) -> List[Outcome]:
+        if any(self._dedup_index_for(request) is not None for request in requests):
+            return self._route_deduplicated(requests, offline_override, isolate_failures)
 
-        outputs: List[RouterOutput] = []
+        outcomes: List[Outcome] = []
+        chunks = list(_chunk(requests, self.config.max_batch_size))
+        for chunk, predicted in self._predict_chunks(chunks, offline_override, isolate_failures):
+            if predicted is None:
+                outcomes.extend(_timeout_errors(len(chunk)))
+                continue
+            predictions, language_contexts = predicted
+            outcomes.extend(
+                self._finalize(request, prediction, language, isolate_failures)
+                for request, prediction, language in zip(
+                    chunk, predictions, language_contexts
+                )
+            )
+        return outcomes
+
+    def _route_deduplicated(
+        self,
+        requests: Sequence[RoutingRequest],
+        offline_override: bool,
+        isolate_failures: bool,
+    ) -> List[Outcome]:
+        """Classify one representative per near-duplicate cluster and fan out.
+
+        Clusters are formed within the batch and matched against decisions
+        from earlier batches held in ``dedup_index``. Fallback decisions are
+        never indexed so a recovered model is not masked by stale fallbacks.
+        Requests tripping the financial guardrail, or without a dedup index,
+        are never collapsed.
+        """
+
+        clusters, cluster_of = self._cluster_requests(requests, offline_override)
         budget_start = time.perf_counter()
-        for chunk in _chunk(normalized, self.config.max_batch_size):
-            elapsed = time.perf_counter() - budget_start
-            if elapsed >= self.config.latency_budget_seconds:
-                raise RouterTimeoutError("Routing exceeded latency budget")
-            outputs.extend(self._route_chunk(chunk, offline_override))
-            elapsed_after_chunk = time.perf_counter() - budget_start
-            if elapsed_after_chunk >= self.config.latency_budget_seconds:
-                raise RouterTimeoutError("Routing exceeded latency budget")
-        return outputs
-
-    def _route_chunk(
+        pending = [cluster for cluster in clusters if not cluster.from_index]
+        self._predict_representatives(
+            requests, pending, offline_override, isolate_failures, budget_start
+        )
+        return self._fan_out(
+            requests, clusters, cluster_of, offline_override, isolate_failures, budget_start
+        )
+
+    def _cluster_requests(
         self, requests: Sequence[RoutingRequest], offline_override: bool
-    ) -> List[RouterOutput]:
-        language_contexts = [self.language_detector.detect(req.text) for req in requests]
-        predictions: List[ModelPrediction]
+    ) -> Tuple[List[_Cluster], List[_Cluster]]:
+        """Group requests into clusters; returns the clusters and each request's."""
+
+        max_chars = self.config.max_prompt_chars
+        # One in-batch index per dedup index, so clusters never span namespaces.
+        batch_indexes: Dict[int, NearDuplicateIndex[_Cluster]] = {}
+        clusters: List[_Cluster] = []
+        cluster_of: List[_Cluster] = []
+        for position, request in enumerate(requests):
+            features = request.features(max_chars)
+            index = self._dedup_index_for(request)
+            if index is None or violates_financial_guardrail(features.text):
+                # Classified on its own so the guardrail sees this exact text.
+                cluster = _Cluster(leader=position, representative_id=request.request_id)
+                clusters.append(cluster)
+                cluster_of.append(cluster)
+                continue
+            batch_index = batch_indexes.get(id(index))
+            if batch_index is None:
+                batch_index = NearDuplicateIndex(
+                    threshold=index.threshold, window_size=len(requests)
+                )
+                batch_indexes[id(index)] = batch_index
+            tokens = dedup_tokens(features.tokens)
+            signature = index.signature(tokens)
+            found = batch_index.query(tokens, signature)
+            if found is not None:
+                found.members.append(position)
+                cluster_of.append(found)
+                continue
+            cluster = _Cluster(
+                leader=position,
+                representative_id=request.request_id,
+                index=index,
+                tokens=tokens,
+                signature=signature,
+            )
+            indexed = None if offline_override else index.query(tokens, signature)
+            if indexed is not None:
+                cluster.prediction, cluster.language, cluster.representative_id = indexed
+                cluster.from_index = True
+            batch_index.add(tokens, cluster, signature)
+            clusters.append(cluster)
+            cluster_of.append(cluster)
+        return clusters, cluster_of
+
+    def _predict_representatives(
+        self,
+        requests: Sequence[RoutingRequest],
+        pending: Sequence[_Cluster],
+        offline_override: bool,
+        isolate_failures: bool,
+        budget_start: float,
+    ) -> None:
+        """Classify each pending cluster's leader and index reusable decisions."""
+
+        cluster_chunks = list(_chunk(pending, self.config.max_batch_size))
+        request_chunks = [
+            [requests[cluster.leader] for cluster in chunk] for chunk in cluster_chunks
+        ]
+        predicted_chunks = self._predict_chunks(
+            request_chunks, offline_override, isolate_failures, budget_start
+        )
+        for (_, predicted), chunk in zip(predicted_chunks, cluster_chunks):
+            if predicted is None:
+                for cluster in chunk:
+                    cluster.prediction = RouterTimeoutError("Routing exceeded latency budget")
+                continue
+            predictions, language_contexts = predicted
+            for cluster, prediction, language in zip(chunk, predictions, language_contexts):
+                cluster.prediction, cluster.language = prediction, language
+                if (
+                    cluster.index is not None
+                    and isinstance(prediction, ModelPrediction)
+                    and not prediction.fallback_used
+                ):
+                    cluster.index.add(
+                        cluster.tokens,
+                        (prediction, language, cluster.representative_id),
+                        cluster.signature,
+                    )
+
+    def _fan_out(
+        self,
+        requests: Sequence[RoutingRequest],
+        clusters: Sequence[_Cluster],
+        cluster_of: Sequence[_Cluster],
+        offline_override: bool,
+        isolate_failures: bool,
+        budget_start: float,
+    ) -> List[Outcome]:
+        """Finalize every request in input order from its cluster's decision.
+
+        Leaders are finalized first: when one fails, the members of its
+        cluster are classified on their own instead of inheriting the error.
+        """
+
+        finished: Dict[int, Outcome] = {}
+        retried: List[int] = []
+        for cluster in clusters:
+            if cluster.from_index:
+                continue
+            outcome = self._finalize(
+                requests[cluster.leader],
+                cluster.prediction,  # type: ignore[arg-type]
+                cluster.language,
+                isolate_failures,
+                emit=False,
+            )
+            finished[cluster.leader] = outcome
+            failed = isinstance(outcome, RouterError)
+            if failed and not isinstance(outcome, RouterTimeoutError):
+                retried.extend(cluster.members)
+        finished.update(
+            self._classify_individually(
+                requests, sorted(retried), offline_override, isolate_failures, budget_start
+            )
+        )
+
+        outcomes: List[Outcome] = []
+        for position, request in enumerate(requests):
+            outcome = finished.get(position)
+            if outcome is None:
+                cluster = cluster_of[position]
+                prediction = cluster.prediction
+                if isinstance(prediction, RouterError):
+                    # Only latency timeouts reach here; each item gets its own.
+                    prediction = RouterTimeoutError(str(prediction))
+                outcome = self._finalize(
+                    request,
+                    prediction,  # type: ignore[arg-type]
+                    cluster.language,
+                    isolate_failures,
+                    "index" if cluster.from_index else "batch",
+                    cluster.representative_id,
+                    emit=False,
+                )
+            if not isinstance(outcome, RouterError):
+                self._emit_telemetry(outcome, request)
+            outcomes.append(outcome)
+        return outcomes
+
+    def _classify_individually(
+        self,
+        requests: Sequence[RoutingRequest],
+        positions: Sequence[int],
+        offline_override: bool,
+        isolate_failures: bool,
+        budget_start: float,
+    ) -> Dict[int, Outcome]:
+        outcomes: Dict[int, Outcome] = {}
+        position_chunks = list(_chunk(positions, self.config.max_batch_size))
+        request_chunks = [
+            [requests[position] for position in chunk] for chunk in position_chunks
+        ]
+        predicted_chunks = self._predict_chunks(
+            request_chunks, offline_override, isolate_failures, budget_start
+        )
+        for (chunk, predicted), chunk_positions in zip(predicted_chunks, position_chunks):
+            if predicted is None:
+                outcomes.update(zip(chunk_positions, _timeout_errors(len(chunk))))
+                continue
+            predictions, language_contexts = predicted
+            for position, request, prediction, language in zip(
+                chunk_positions, chunk, predictions, language_contexts
+            ):
+                outcomes[position] = self._finalize(
+                    request, prediction, language, isolate_failures, emit=False
+                )
+        return outcomes
+
+    def _predict_chunks(
+        self,
+        chunks: Sequence[List[RoutingRequest]],
+        offline_override: bool,
+        isolate_failures: bool,
+        budget_start: float | None = None,
+    ) -> Iterator[Tuple[List[RoutingRequest], Optional[ChunkPrediction]]]:
+        """Yield predictions per chunk in input order within the latency budget.
+
+        With an executor configured at most ``max_chunks_in_flight`` chunks
+        run at once and results are collected in order. Chunks that do not finish inside the budget raise
+        ``RouterTimeoutError``, or yield ``None`` when failures are isolated.
+        """
+
+        budget = self.config.latency_budget_seconds
+        if budget_start is None:
+            budget_start = time.perf_counter()
+        if self._executor is None or len(chunks) <= 1:
+            exhausted = False
+            for chunk in chunks:
+                if exhausted or time.perf_counter() - budget_start >= budget:
+                    if not isolate_failures:
+                        raise RouterTimeoutError("Routing exceeded latency budget")
+                    exhausted = True
+                    yield chunk, None
+                    continue
+                yield chunk, self._predict_chunk(chunk, offline_override, isolate_failures)
+                if not isolate_failures and time.perf_counter() - budget_start >= budget:
+                    raise RouterTimeoutError("Routing exceeded latency budget")
+            return
+
+        # Submit through a sliding window so one batch cannot monopolize a
+        # (possibly shared) pool; unsubmitted chunks never start after a timeout.
+        executor = self._executor
+        window = self.config.max_chunks_in_flight or self.config.max_workers
+        unsubmitted = iter(chunks)
+        in_flight: Deque[Tuple[List[RoutingRequest], Future[ChunkPrediction]]] = deque()
+
+        def refill() -> None:
+            while len(in_flight) < window:
+                chunk = next(unsubmitted, None)
+                if chunk is None:
+                    return
+                in_flight.append(
+                    (
+                        chunk,
+                        executor.submit(
+                            self._predict_chunk, chunk, offline_override, isolate_failures
+                        ),
+                    )
+                )
+
+        exhausted = False
+        try:
+            refill()
+            while in_flight:
+                chunk, future = in_flight.popleft()
+                remaining = budget - (time.perf_counter() - budget_start)
+                try:
+                    predicted = future.result(timeout=max(remaining, 0.0))
+                except FuturesTimeoutError:
+                    if not isolate_failures:
+                        raise RouterTimeoutError("Routing exceeded latency budget") from None
+                    future.cancel()
+                    exhausted = True
+                    yield chunk, None
+                    continue
+                if not exhausted:
+                    refill()
+                yield chunk, predicted
+            for chunk in unsubmitted:
+                yield chunk, None
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
+    def _finalize(
+        self,
+        request: RoutingRequest,
+        prediction: ModelPrediction | RouterError,
+        language: LanguageContext,
+        isolate_failures: bool,
+        dedup_source: str | None = None,
+        representative_id: str | None = None,
+        emit: bool = True,
+    ) -> Outcome:
+        if isinstance(prediction, RouterError):
+            return prediction
+        if dedup_source is not None:
+            prediction = replace(
+                prediction,
+                metadata={
+                    key: value
+                    for key, value in prediction.metadata.items()
+                    if key not in _TEXT_DERIVED_METADATA
+                },
+            )
+        output = self._build_output(request, prediction, language)
+        if dedup_source is not None:
+            output.metadata["dedup_source"] = dedup_source
+            output.metadata["dedup_representative_id"] = representative_id
+        try:
+            validate_router_output(output.as_dict())
+        except SchemaValidationError as error:
+            if not isolate_failures:
+                raise
+            return error
+        if emit:
+            self._emit_telemetry(output, request)
+        return output
+
+    def _predict_chunk(
+        self,
+        requests: Sequence[RoutingRequest],
+        offline_override: bool,
+        isolate_failures: bool = False,
+    ) -> Tuple[List[ModelPrediction | RouterError], List[LanguageContext]]:
+        max_chars = self.config.max_prompt_chars
+        language_contexts = [
+            self.language_detector.detect_normalized(req.features(max_chars).full_folded)
+            for req in requests
+        ]
+        cached_groups: Dict[int, Tuple[PersistentDecisionCache, List[int]]] = {}
+        uncached: List[int] = []
+        for position, request in enumerate(requests):
+            cache = None if offline_override else self._decision_cache_for(request)
+            if cache is None:
+                uncached.append(position)
+            else:
+                cached_groups.setdefault(id(cache), (cache, []))[1].append(position)
+        if not cached_groups:
+            predictions = self._classify_chunk(
+                requests, language_contexts, offline_override, isolate_failures
+            )
+            return predictions, language_contexts
+
+        resolved: List[Optional[ModelPrediction | RouterError]] = [None] * len(requests)
+        # Misses sharing a cache and key are identical texts, classified once.
+        misses: Dict[Tuple[int, str], List[int]] = {}
+        miss_caches: List[Optional[PersistentDecisionCache]] = []
+        miss_keys: List[Optional[str]] = []
+        miss_positions: List[List[int]] = []
+        for cache_id, (cache, positions) in cached_groups.items():
+            keys = [
+                cache.key_for(requests[position].features(max_chars)) for position in positions
+            ]
+            for position, key, cached in zip(positions, keys, cache.get_many(keys)):
+                if cached is not None:
+                    resolved[position] = replace(
+                        cached, metadata={**cached.metadata, "decision_cache": "hit"}
+                    )
+                elif (cache_id, key) in misses:
+                    misses[(cache_id, key)].append(position)
+                else:
+                    misses[(cache_id, key)] = [position]
+                    miss_caches.append(cache)
+                    miss_keys.append(key)
+                    miss_positions.append(misses[(cache_id, key)])
+        for position in uncached:
+            miss_caches.append(None)
+            miss_keys.append(None)
+            miss_positions.append([position])
+
+        if miss_positions:
+            firsts = [positions[0] for positions in miss_positions]
+            classified = self._classify_chunk(
+                [requests[position] for position in firsts],
+                [language_contexts[position] for position in firsts],
+                offline_override,
+                isolate_failures,
+            )
+            writes: Dict[
+                int, Tuple[PersistentDecisionCache, List[Tuple[str, ModelPrediction]]]
+            ] = {}
+            for cache, key, positions, prediction in zip(
+                miss_caches, miss_keys, miss_positions, classified
+            ):
+                for position in positions:
+                    resolved[position] = prediction
+                if (
+                    cache is not None
+                    and key is not None
+                    and isinstance(prediction, ModelPrediction)
+                    and not prediction.fallback_used
+                ):
+                    writes.setdefault(id(cache), (cache, []))[1].append((key, prediction))
+            for cache, entries in writes.values():
+                cache.put_many(entries)
+        predictions = [prediction for prediction in resolved if prediction is not None]
+        return predictions, language_contexts
+
+    def _classify_chunk(
+        self,
+        requests: Sequence[RoutingRequest],
+        language_contexts: Sequence[LanguageContext],
+        offline_override: bool,
+        isolate_failures: bool,
+    ) -> List[ModelPrediction | RouterError]:
         try:
             if offline_override:
                 raise RouterModelUnavailableError("Offline override engaged")
-            predictions = self.llm_client.classify(requests, language_contexts)
+            if isolate_failures:
+                return self._classify_isolated(requests, language_contexts)
+            return list(self.llm_client.classify(requests, language_contexts))
         except (RouterModelUnavailableError, RouterTimeoutError) as error:
-            predictions = [
+            return [
                 self.fallback_router.route(request, language, str(error))
                 for request, language in zip(requests, language_contexts)
             ]
 
-        outputs: List[RouterOutput] = []
-        for request, prediction, language in zip(
-            requests, predictions, language_contexts
-        ):
-            output = self._build_output(request, prediction, language)
-            validate_router_output(output.as_dict())
-            outputs.append(output)
-            self._emit_telemetry(output, request)
-        return outputs
+    def _classify_isolated(
+        self,
+        requests: Sequence[RoutingRequest],
+        language_contexts: Sequence[LanguageContext],
+    ) -> List[ModelPrediction | RouterError]:
+        """Classify a chunk so that a failing item does not cancel its peers.
+
+        Clients exposing ``classify_items`` report errors per item directly;
+        other clients are retried one item at a time after a chunk failure.
+        """
+
+        classify_items = getattr(self.llm_client, "classify_items", None)
+        if classify_items is not None:
+            return list(classify_items(requests, language_contexts))
+        try:
+            return list(self.llm_client.classify(requests, language_contexts))
+        except (RouterModelUnavailableError, RouterTimeoutError):
+            raise
+        except RouterError:
+            pass
+
+        results: List[ModelPrediction | RouterError] = []
+        for request, language in zip(requests, language_contexts):
+            try:
+                results.extend(self.llm_client.classify([request], [language]))
+            except (RouterModelUnavailableError, RouterTimeoutError):
+                raise
+            except RouterError as error:
+                results.append(error)
+        return results
+
+    def _decision_cache_for(
+        self, request: RoutingRequest
+    ) -> PersistentDecisionCache | None:
+        return self.decision_cache
+
+    def _dedup_index_for(
+        self, request: RoutingRequest
+    ) -> NearDuplicateIndex[Decision] | None:
+        return self.dedup_index
+
+    def _labels_for(self, request: RoutingRequest) -> Sequence[str]:
+        return self.config.classification_labels
 
     def _build_output(
         self,
@@ -98,6 +677,7 @@ class IntentRouterService:
         prediction: ModelPrediction,
         language: LanguageContext,
     ) -> RouterOutput:
+        prediction = _clamp_to_labels(prediction, self._labels_for(request))
         metadata = {
             **request.metadata,
             **prediction.metadata,
@@ -151,8 +731,8 @@ class IntentRouterService:
         return normalized
 
 
-def _chunk(sequence: Sequence[RoutingRequest], size: int) -> Iterable[List[RoutingRequest]]:
-    chunk: List[RoutingRequest] = []
+def _chunk(sequence: Sequence[T], size: int) -> Iterable[List[T]]:
+    chunk: List[T] = []
     for item in sequence:
         chunk.append(item)
         if len(chunk) == size:
@@ -162,4 +742,8 @@ def _chunk(sequence: Sequence[RoutingRequest], size: int) -> Iterable[List[Routi
         yield chunk
 
 
+def _timeout_errors(count: int) -> List[RouterError]:
+    return [RouterTimeoutError("Routing exceeded latency budget") for _ in range(count)]
+
+
 __all__ = ["IntentRouterService"]
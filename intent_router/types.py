@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional
+
+from .exceptions import RouterError
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
 
 
 @dataclass(slots=True)
@@ -13,6 +19,51 @@ class LanguageContext:
     source: str = "lingua-offline"
 
 
+@dataclass(frozen=True, slots=True)
+class RequestFeatures:
+    """Normalized text features shared by every routing stage.
+
+    ``text`` and ``folded`` are truncated to the prompt limit for the model;
+    ``full_folded`` keeps the whole case-folded text for language detection
+    and the regex fallback, which have always scanned the full utterance.
+    ``tokens`` is only computed when a stage (dedup) asks for it.
+    """
+
+    text: str
+    folded: str
+    full_folded: str
+    max_chars: Optional[int] = None
+    source: str = field(default="", repr=False, compare=False)
+    _tokens: Optional[FrozenSet[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def tokens(self) -> FrozenSet[str]:
+        tokens = self._tokens
+        if tokens is None:
+            tokens = frozenset(_TOKEN_PATTERN.findall(self.folded))
+            object.__setattr__(self, "_tokens", tokens)
+        return tokens
+
+    @classmethod
+    def from_text(cls, text: str, max_chars: Optional[int] = None) -> "RequestFeatures":
+        stripped = text.strip()
+        full_folded = stripped.lower()
+        if max_chars is None or len(stripped) <= max_chars:
+            normalized, folded = stripped, full_folded
+        else:
+            normalized = stripped[:max_chars]
+            folded = normalized.lower()
+        return cls(
+            text=normalized,
+            folded=folded,
+            full_folded=full_folded,
+            max_chars=max_chars,
+            source=text,
+        )
+
+
 @dataclass(slots=True)
 class RoutingRequest:
     """Normalized representation of a routing invocation."""
@@ -20,6 +71,29 @@ class RoutingRequest:
     text: str
     metadata: Dict[str, Any] = field(default_factory=dict)
     request_id: Optional[str] = None
+    tenant_id: Optional[str] = None
+    _features: Optional[RequestFeatures] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def features(self, max_chars: Optional[int] = None) -> RequestFeatures:
+        """Return the cached feature bundle, computing it on first use.
+
+        Passing ``max_chars=None`` reuses whatever bundle an earlier stage
+        computed, so downstream components need not know the prompt limit.
+        The bundle is rebuilt if ``text`` has been reassigned since.
+        """
+
+        cached = self._features
+        if (
+            cached is not None
+            and cached.source is self.text
+            and (max_chars is None or cached.max_chars == max_chars)
+        ):
+            return cached
+        cached = RequestFeatures.from_text(self.text, max_chars)
+        self._features = cached
+        return cached
 
 
 @dataclass(slots=True)
@@ -51,8 +125,23 @@ class RouterOutput:
         return asdict(self)
 
 
+@dataclass(slots=True)
+class BatchItemResult:
+    """Result-or-error slot for one request of a partial batch."""
+
+    request_id: Optional[str]
+    output: Optional[RouterOutput] = None
+    error: Optional[RouterError] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 __all__ = [
+    "BatchItemResult",
     "LanguageContext",
+    "RequestFeatures",
     "RoutingRequest",
     "ModelPrediction",
     "RouterOutput",
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import random
+import sqlite3
+import string
+import sys
+import threading
+import time
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
-from intent_router import IntentRouterConfig, IntentRouterService
-from intent_router.exceptions import RouterModelUnavailableError, SchemaValidationError
-from intent_router.types import ModelPrediction
+from intent_router import IntentRouterConfig, IntentRouterRegistry, IntentRouterService
+from intent_router.cache import PersistentDecisionCache
+from intent_router.dedup import NearDuplicateIndex
+from intent_router.exceptions import (
+    FinancialAdviceViolation,
+    RouterConfigurationError,
+    RouterModelUnavailableError,
+    RouterTimeoutError,
+    SchemaValidationError,
+)
+from intent_router.qwen import LightweightQwenIntentModel
+from intent_router.types import ModelPrediction, RoutingRequest
 from intent_router.telemetry import ComplianceLogger
 
 
@@ -81,3 +97,620 @@ def test_offline_fallback_takeover(weights_dir: Path) -> None:
     assert result.metadata["fallback_rule"] == "sales"
     assert "offline weights unavailable" in result.metadata["fallback_reason"]
     assert telemetry_sink[0]["fallback_used"] is True
+
+
+def test_request_features_are_computed_once_and_shared(weights_dir: Path) -> None:
+    service = IntentRouterService(
+        IntentRouterConfig(model_path=weights_dir, max_prompt_chars=24),
+    )
+    request = RoutingRequest(text="  Refund my INVOICE please, it is wrong  ")
+
+    result = service.route_batch([request])[0]
+    features = request.features()
+
+    assert result.intent == "billing_support"
+    assert features.text == "Refund my INVOICE please"
+    assert features.folded == features.text.lower()
+    assert "invoice" in features.tokens
+    assert request.features(24) is features
+
+
+class CountingLLM:
+    def __init__(self, config: IntentRouterConfig) -> None:
+        self.inner = LightweightQwenIntentModel(config)
+        self.classified = 0
+
+    def classify(self, requests, languages):
+        self.classified += len(requests)
+        return self.inner.classify(requests, languages)
+
+
+def test_near_duplicates_are_classified_once(weights_dir: Path) -> None:
+    telemetry_sink = []
+    config = IntentRouterConfig(model_path=weights_dir, dedup_enabled=True)
+    llm = CountingLLM(config)
+    service = IntentRouterService(
+        config, llm_client=llm, telemetry=ComplianceLogger(sink=telemetry_sink)
+    )
+    template = "Hi, I was charged twice on invoice {order} for my plan, please refund it"
+    batch = [
+        RoutingRequest(text=template.format(order=order), request_id=f"req-{order}")
+        for order in range(1000, 1010)
+    ]
+    batch.append(RoutingRequest(text="My login keeps failing", request_id="odd-one"))
+
+    results = service.route_batch(batch)
+
+    assert llm.classified == 2
+    assert [r.metadata["request_id"] for r in results] == [r.request_id for r in batch]
+    assert results[0].intent == "billing_support"
+    assert results[1].metadata["dedup_source"] == "batch"
+    assert results[-1].intent == "account_security"
+    assert [event["request_id"] for event in telemetry_sink] == [r.request_id for r in batch]
+
+    follow_up = service.route(template.format(order=4242) + "!", request_id="later")
+
+    assert llm.classified == 2
+    assert follow_up.metadata["dedup_source"] == "index"
+    assert follow_up.metadata["request_id"] == "later"
+
+
+class BadSecondItemLLM:
+    def classify(self, requests, languages):
+        if any("broken" in request.text for request in requests):
+            raise SchemaValidationError("upstream returned malformed payload")
+        return [
+            ModelPrediction(
+                intent="technical_support",
+                confidence=0.8,
+                reasoning="stubbed",
+                language=language.language_code,
+            )
+            for language in languages
+        ]
+
+
+def test_partial_batch_isolates_guardrail_failures(weights_dir: Path) -> None:
+    telemetry_sink = []
+    service = IntentRouterService(
+        IntentRouterConfig(model_path=weights_dir, max_batch_size=3),
+        telemetry=ComplianceLogger(sink=telemetry_sink),
+    )
+    batch = [
+        RoutingRequest(text="Refund my invoice", request_id="a"),
+        RoutingRequest(text="Give me a stock tip", request_id="b"),
+        RoutingRequest(text="Reset my password", request_id="c"),
+        RoutingRequest(text="There is a bug in the app", request_id="d"),
+    ]
+
+    results = service.route_batch_partial(batch)
+
+    assert [result.request_id for result in results] == ["a", "b", "c", "d"]
+    assert [result.ok for result in results] == [True, False, True, True]
+    assert isinstance(results[1].error, FinancialAdviceViolation)
+    assert results[2].output.intent == "account_security"
+    assert [event["request_id"] for event in telemetry_sink] == ["a", "c", "d"]
+
+    with pytest.raises(FinancialAdviceViolation):
+        service.route_batch(batch)
+
+
+def test_partial_batch_retries_items_for_plain_clients(weights_dir: Path) -> None:
+    service = IntentRouterService(
+        IntentRouterConfig(model_path=weights_dir),
+        llm_client=BadSecondItemLLM(),
+    )
+
+    results = service.route_batch_partial(["app crashed", "broken payload", "error 500"])
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, SchemaValidationError)
+    assert results[0].output.intent == "technical_support"
+
+
+class BarrierLLM:
+    """Only succeeds when all chunks are classified concurrently."""
+
+    def __init__(self, parties: int) -> None:
+        self.barrier = threading.Barrier(parties, timeout=2)
+
+    def classify(self, requests, languages):
+        self.barrier.wait()
+        return [
+            ModelPrediction(
+                intent="technical_support",
+                confidence=0.8,
+                reasoning="stubbed",
+                language=language.language_code,
+                metadata={"text": request.text},
+            )
+            for request, language in zip(requests, languages)
+        ]
+
+
+def test_chunks_run_concurrently_with_ordered_results(weights_dir: Path) -> None:
+    telemetry_sink = []
+    texts = [f"ticket {index}" for index in range(6)]
+    with IntentRouterService(
+        IntentRouterConfig(model_path=weights_dir, max_batch_size=2, max_workers=3),
+        llm_client=BarrierLLM(parties=3),
+        telemetry=ComplianceLogger(sink=telemetry_sink),
+    ) as service:
+        results = service.route_batch(
+            [RoutingRequest(text=text, request_id=text) for text in texts]
+        )
+
+    assert [result.metadata["text"] for result in results] == texts
+    assert [event["request_id"] for event in telemetry_sink] == texts
+
+
+class SlowLLM:
+    def classify(self, requests, languages):
+        time.sleep(0.2)
+        return UnavailableLLM().classify(requests, languages)
+
+
+def test_parallel_chunks_respect_batch_latency_budget(weights_dir: Path) -> None:
+    with IntentRouterService(
+        IntentRouterConfig(
+            model_path=weights_dir,
+            max_batch_size=1,
+            max_workers=2,
+            latency_budget_seconds=0.05,
+        ),
+        llm_client=SlowLLM(),
+    ) as service:
+        results = service.route_batch_partial(["first", "second"])
+
+        with pytest.raises(RouterTimeoutError):
+            service.route_batch(["first", "second"])
+
+    assert all(isinstance(result.error, RouterTimeoutError) for result in results)
+
+
+def test_decision_cache_survives_restarts(weights_dir: Path, tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache" / "decisions.sqlite"
+    config = IntentRouterConfig(
+        model_path=weights_dir,
+        decision_cache_path=cache_path,
+        decision_cache_warm_entries=10,
+    )
+    with IntentRouterService(config, llm_client=CountingLLM(config)) as first:
+        first.route_batch(["Refund my invoice", "Refund my invoice", "Reset my password"])
+        assert first.llm_client.classified == 2
+
+    llm = CountingLLM(config)
+    with IntentRouterService(config, llm_client=llm) as restarted:
+        result = restarted.route("  REFUND my invoice ", request_id="after-deploy")
+
+    assert llm.classified == 0
+    assert result.intent == "billing_support"
+    assert result.metadata["decision_cache"] == "hit"
+    assert result.metadata["request_id"] == "after-deploy"
+
+
+def test_decision_cache_evicts_coldest_entries(tmp_path: Path) -> None:
+    cache = PersistentDecisionCache(
+        tmp_path / "decisions.sqlite",
+        router_version="router-v1",
+        classification_labels=("billing_support",),
+        max_entries=2,
+    )
+    keys = [cache.key_for(RoutingRequest(text=text).features()) for text in "abc"]
+    prediction = ModelPrediction(
+        intent="billing_support", confidence=0.9, reasoning="cached", language="en"
+    )
+    cache.put_many([(keys[0], prediction), (keys[1], prediction)])
+    cache.get_many([keys[0]])
+    cache.put_many([(keys[2], prediction)])
+
+    assert len(cache) == 2
+    assert cache.get_many(keys)[1] is None
+    assert cache.get_many([keys[0]])[0].intent == "billing_support"
+    cache.close()
+
+
+def test_decision_cache_warm_start_stays_in_namespace(tmp_path: Path) -> None:
+    path = tmp_path / "decisions.sqlite"
+    with sqlite3.connect(path) as legacy:
+        legacy.execute(
+            "CREATE TABLE decisions (key TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+            "hits INTEGER NOT NULL DEFAULT 0, last_used REAL NOT NULL)"
+        )
+    prediction = ModelPrediction(
+        intent="billing_support", confidence=0.9, reasoning="cached", language="en"
+    )
+    old = PersistentDecisionCache(path, "router-v1", ("billing_support",))
+    old.put_many([(old.key_for(RoutingRequest(text="refund").features()), prediction)])
+    old.close()
+
+    new = PersistentDecisionCache(path, "router-v2", ("billing_support",))
+    assert new.warm_start(10) == 0
+    new.close()
+    reopened = PersistentDecisionCache(path, "router-v1", ("billing_support",))
+    assert reopened.warm_start(10) == 1
+    reopened.close()
+
+
+def test_decision_cache_errors_degrade_to_misses(
+    weights_dir: Path, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    cache_path = tmp_path / "decisions.sqlite"
+    config = IntentRouterConfig(model_path=weights_dir, decision_cache_path=cache_path)
+    llm = CountingLLM(config)
+    with IntentRouterService(config, llm_client=llm) as service:
+        service.route_batch(["Refund my invoice"])
+        with sqlite3.connect(cache_path) as other:
+            other.execute("DROP TABLE decisions")
+
+        outputs = service.route_batch(["Refund my invoice"])
+        results = service.route_batch_partial(["Reset my password"])
+
+    assert outputs[0].intent == "billing_support"
+    assert "decision_cache" not in outputs[0].metadata
+    assert results[0].ok
+    assert llm.classified == 3
+    assert "decision cache lookup failed" in caplog.text
+    assert "decision cache write failed" in caplog.text
+
+
+class CountingCallsModel(LightweightQwenIntentModel):
+    def __init__(self, config: IntentRouterConfig) -> None:
+        super().__init__(config)
+        self.calls = 0
+
+    def classify(self, requests, languages, classification_labels=None):
+        self.calls += 1
+        return super().classify(requests, languages, classification_labels)
+
+
+def test_registry_shares_model_across_tenants(weights_dir: Path) -> None:
+    telemetry_sink = []
+    config = IntentRouterConfig(model_path=weights_dir, max_batch_size=8)
+    model = CountingCallsModel(config)
+    with IntentRouterRegistry(config, llm_client=model, telemetry_sink=telemetry_sink) as registry:
+        retail = registry.add_tenant(
+            "retail",
+            classification_labels=("billing_support", "general_inquiry"),
+            router_version="retail-router-v2",
+        )
+        registry.add_tenant("bank", compliance_log_context={"unit": "banking"})
+
+        assert retail.llm_client.model is model
+        assert retail.language_detector is registry.tenant("bank").language_detector
+
+        results = registry.route_batch(
+            [
+                RoutingRequest(text="Refund my invoice", request_id="r1", tenant_id="retail"),
+                RoutingRequest(text="Reset my password", request_id="b1", tenant_id="bank"),
+            ]
+        )
+
+        assert model.calls == 1
+        assert results[0].router_version == "retail-router-v2"
+        assert results[0].metadata["classification_labels"] == ["billing_support", "general_inquiry"]
+        assert results[1].router_version == config.router_version
+        assert telemetry_sink[0]["tenant_id"] == "retail"
+        assert telemetry_sink[1]["unit"] == "banking"
+
+        single = retail.route("Refund please")
+        assert single.metadata["classification_labels"] == ["billing_support", "general_inquiry"]
+
+        registry.remove_tenant("bank")
+        assert registry.tenant_ids == ["retail"]
+        with pytest.raises(RouterConfigurationError):
+            registry.route_batch([RoutingRequest(text="hello", tenant_id="bank")])
+
+
+def test_detector_and_fallback_see_text_beyond_prompt_limit(weights_dir: Path) -> None:
+    service = IntentRouterService(
+        IntentRouterConfig(model_path=weights_dir, max_prompt_chars=20),
+    )
+
+    result = service.route(
+        "hello there, some preamble text. Necesito ayuda con mi factura",
+        offline_override=True,
+    )
+
+    assert result.intent == "billing_support"
+    assert result.language == "es"
+    assert result.metadata["fallback_rule"] == "billing"
+
+
+def test_dedup_never_collapses_guardrail_violations(weights_dir: Path) -> None:
+    config = IntentRouterConfig(model_path=weights_dir, dedup_enabled=True)
+    llm = CountingLLM(config)
+    service = IntentRouterService(config, llm_client=llm)
+    complaint = (
+        "I have been a customer for many years and this month my invoice shows a "
+        "duplicate charge for the premium plan that I never requested so please "
+        "look into the billing history and send the refund to my card soon"
+    )
+
+    results = service.route_batch_partial(
+        [
+            RoutingRequest(text=complaint, request_id="rep"),
+            RoutingRequest(text=complaint + " also any crypto pick for me", request_id="bad"),
+            RoutingRequest(text=complaint + " thanks", request_id="member"),
+        ]
+    )
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, FinancialAdviceViolation)
+    member = results[2].output
+    assert member.metadata["dedup_source"] == "batch"
+    assert member.metadata["dedup_representative_id"] == "rep"
+    assert "prompt_excerpt" not in member.metadata
+    assert "prompt_excerpt" in results[0].output.metadata
+
+    with pytest.raises(FinancialAdviceViolation):
+        service.route(complaint + " give me a stock tip")
+
+    later = service.route(complaint + " cheers", request_id="later")
+    assert later.metadata["dedup_source"] == "index"
+    assert later.metadata["dedup_representative_id"] == "rep"
+
+
+class SchemaBreakingLLM:
+    def classify(self, requests, languages):
+        return [
+            ModelPrediction(
+                intent="billing_support",
+                confidence=1.5 if "zzz" in request.text else 0.8,
+                reasoning="stubbed",
+                language=language.language_code,
+            )
+            for request, language in zip(requests, languages)
+        ]
+
+
+def test_failed_representative_does_not_fail_its_cluster(weights_dir: Path) -> None:
+    telemetry_sink = []
+    service = IntentRouterService(
+        IntentRouterConfig(model_path=weights_dir, dedup_enabled=True),
+        llm_client=SchemaBreakingLLM(),
+        telemetry=ComplianceLogger(sink=telemetry_sink),
+    )
+    complaint = (
+        "my invoice for the premium plan shows a duplicate charge this month and "
+        "I would like the billing team to review it and send the refund quickly"
+    )
+
+    results = service.route_batch_partial(
+        [
+            RoutingRequest(text=complaint + " zzz", request_id="rep"),
+            RoutingRequest(text=complaint + " ok", request_id="m1"),
+            RoutingRequest(text=complaint + " please", request_id="m2"),
+        ]
+    )
+
+    assert [result.ok for result in results] == [False, True, True]
+    assert isinstance(results[0].error, SchemaValidationError)
+    assert "dedup_source" not in results[1].output.metadata
+    assert [event["request_id"] for event in telemetry_sink] == ["m1", "m2"]
+
+
+def test_decision_cache_keeps_new_entries_once_all_are_hot(tmp_path: Path) -> None:
+    cache = PersistentDecisionCache(
+        tmp_path / "decisions.sqlite",
+        router_version="router-v1",
+        classification_labels=("billing_support",),
+        max_entries=3,
+        hit_flush_interval_seconds=0.0,
+    )
+    keys = [cache.key_for(RoutingRequest(text=text).features()) for text in "abcde"]
+    prediction = ModelPrediction(
+        intent="billing_support", confidence=0.9, reasoning="cached", language="en"
+    )
+    cache.put_many([(key, prediction) for key in keys[:3]])
+    assert all(cache.get_many(keys[:3]))
+
+    cache.put_many([(keys[3], prediction)])
+    cache.put_many([(keys[4], prediction)])
+
+    assert len(cache) == 3
+    assert cache.get_many(keys[3:]) == [prediction, prediction]
+
+    # Hits are flushed on lookup without waiting for another write.
+    with sqlite3.connect(tmp_path / "decisions.sqlite") as reader:
+        hits = dict(reader.execute("SELECT key, hits FROM decisions").fetchall())
+    assert hits[keys[3]] == 1 and hits[keys[4]] == 1
+    cache.close()
+
+
+def test_registry_mixed_batches_use_tenant_cache_and_dedup(
+    weights_dir: Path, tmp_path: Path
+) -> None:
+    config = IntentRouterConfig(
+        model_path=weights_dir,
+        dedup_enabled=True,
+        decision_cache_path=tmp_path / "decisions.sqlite",
+    )
+    model = CountingCallsModel(config)
+    with IntentRouterRegistry(config, llm_client=model) as registry:
+        registry.add_tenant("retail", classification_labels=("billing_support", "general_inquiry"))
+        registry.add_tenant("bank")
+        complaint = (
+            "my invoice for the premium plan shows a duplicate charge this month and "
+            "I would like the billing team to review it and send the refund quickly"
+        )
+
+        first = registry.route_batch(
+            [
+                RoutingRequest(text=complaint, request_id="r1", tenant_id="retail"),
+                RoutingRequest(text=complaint + " thanks", request_id="r2", tenant_id="retail"),
+                RoutingRequest(text=complaint, request_id="b1", tenant_id="bank"),
+            ]
+        )
+        second = registry.route_batch(
+            [RoutingRequest(text=complaint, request_id="r3", tenant_id="retail")]
+        )
+
+    assert first[1].metadata["dedup_source"] == "batch"
+    assert "dedup_source" not in first[2].metadata
+    assert second[0].metadata["dedup_source"] == "index"
+    assert model.calls == 1
+
+    restarted_config = replace(config, dedup_enabled=False)
+    with IntentRouterRegistry(restarted_config) as restarted:
+        restarted.add_tenant("retail", classification_labels=("billing_support", "general_inquiry"))
+        cached = restarted.route_batch(
+            [RoutingRequest(text=complaint, request_id="r4", tenant_id="retail")]
+        )
+
+    assert cached[0].metadata["decision_cache"] == "hit"
+
+
+def test_registry_clamps_intents_to_tenant_labels(weights_dir: Path) -> None:
+    with IntentRouterRegistry(IntentRouterConfig(model_path=weights_dir)) as registry:
+        retail = registry.add_tenant(
+            "retail", classification_labels=("billing_support", "general_inquiry")
+        )
+
+        result = retail.route("Reset my password")
+
+    assert result.intent == "general_inquiry"
+    assert result.metadata["intent_clamped_from"] == "account_security"
+
+
+def test_registry_clamps_fallback_intents_to_tenant_labels(weights_dir: Path) -> None:
+    config = IntentRouterConfig(model_path=weights_dir, offline_mode=True)
+    with IntentRouterRegistry(config) as registry:
+        retail = registry.add_tenant(
+            "retail", classification_labels=("billing_support", "general_inquiry")
+        )
+        registry.add_tenant("support")
+
+        single = retail.route("There is a bug, error 500")
+        mixed = registry.route_batch(
+            [
+                RoutingRequest(text="There is a bug, error 500", tenant_id="retail"),
+                RoutingRequest(text="There is a bug, error 500", tenant_id="support"),
+            ]
+        )
+
+    assert single.fallback_used
+    assert single.intent == "general_inquiry"
+    assert single.metadata["intent_clamped_from"] == "technical_support"
+    assert [output.intent for output in mixed] == ["general_inquiry", "technical_support"]
+
+
+def test_registry_batch_survives_tenant_removal_in_flight(weights_dir: Path) -> None:
+    telemetry_sink = []
+    config = IntentRouterConfig(model_path=weights_dir)
+    registry = IntentRouterRegistry(
+        config, llm_client=CountingCallsModel(config), telemetry_sink=telemetry_sink
+    )
+    registry.add_tenant("retail", router_version="retail-router-v2")
+    registry.add_tenant("bank")
+
+    original_classify = registry.llm_client.classify
+
+    def classify_then_remove(requests, languages, classification_labels=None):
+        registry.remove_tenant("retail")
+        return original_classify(requests, languages, classification_labels)
+
+    registry.llm_client.classify = classify_then_remove
+    results = registry.route_batch_partial(
+        [
+            RoutingRequest(text="Refund my invoice", request_id="r1", tenant_id="retail"),
+            RoutingRequest(text="Reset my password", request_id="b1", tenant_id="bank"),
+        ]
+    )
+    registry.close()
+
+    assert all(result.ok for result in results)
+    assert results[0].output.router_version == "retail-router-v2"
+    assert [event["tenant_id"] for event in telemetry_sink] == ["retail", "bank"]
+
+
+def test_request_features_follow_text_changes(weights_dir: Path) -> None:
+    service = IntentRouterService(IntentRouterConfig(model_path=weights_dir))
+    request = RoutingRequest(text="Refund my invoice")
+
+    assert service.route_batch([request])[0].intent == "billing_support"
+    assert request.features()._tokens is None
+
+    request.text = "Reset my password"
+
+    assert service.route_batch([request])[0].intent == "account_security"
+    assert request.features().text == "Reset my password"
+
+
+def _run_threads(target, count: int = 8) -> list:
+    errors = []
+
+    def guarded(seed: int) -> None:
+        try:
+            target(random.Random(seed))
+        except Exception as error:  # surfaced through the caller's assertion
+            errors.append(error)
+
+    previous_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    threads = [threading.Thread(target=guarded, args=(seed,)) for seed in range(count)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(previous_interval)
+    return errors
+
+
+def _random_tokens(rng: random.Random, count: int) -> frozenset:
+    return frozenset(
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(5)) for _ in range(count)
+    )
+
+
+def test_near_duplicate_index_is_thread_safe() -> None:
+    index = NearDuplicateIndex(window_size=8)
+
+    def hammer(rng: random.Random) -> None:
+        for _ in range(600):
+            tokens = _random_tokens(rng, 6)
+            index.add(tokens, 1)
+            index.query(tokens)
+
+    assert _run_threads(hammer) == []
+    assert len(index) == 8
+
+
+def test_dedup_service_is_safe_across_threads(weights_dir: Path) -> None:
+    service = IntentRouterService(
+        IntentRouterConfig(model_path=weights_dir, dedup_enabled=True, dedup_window_size=8),
+    )
+
+    def route(rng: random.Random) -> None:
+        for _ in range(20):
+            service.route_batch([" ".join(_random_tokens(rng, 8)) for _ in range(6)])
+
+    assert _run_threads(route) == []
+    assert len(service.dedup_index) <= 8
+
+
+class SlowForTaggedLLM:
+    def classify(self, requests, languages):
+        if any("slow" in request.text for request in requests):
+            time.sleep(0.5)
+        return UnavailableLLM().classify(requests, languages)
+
+
+def test_timed_out_batch_does_not_block_next_batch(weights_dir: Path) -> None:
+    with IntentRouterService(
+        IntentRouterConfig(
+            model_path=weights_dir,
+            max_batch_size=1,
+            max_workers=4,
+            max_chunks_in_flight=2,
+            latency_budget_seconds=0.2,
+        ),
+        llm_client=SlowForTaggedLLM(),
+    ) as service:
+        slow = service.route_batch_partial([f"slow ticket {index}" for index in range(6)])
+        fast = service.route_batch_partial(["refund my invoice", "reset my password"])
+
+    assert not any(result.ok for result in slow)
+    assert all(result.ok for result in fast)